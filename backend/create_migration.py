@@ -12,23 +12,25 @@ from pathlib import Path
 backend_dir = Path(__file__).parent
 sys.path.insert(0, str(backend_dir))
 
-# Import all models to ensure they're registered
-from backend.src.models.base import Base
-from backend.src.models.user import User
-from backend.src.models.organization import Organization  
-from backend.src.models.project import Project
-from backend.src.models.story import Story
-from backend.src.models.document import Document
-from backend.src.models.integration import Integration
-from backend.src.models.analytics import AnalyticsEvent
-from backend.src.models.ai_context import AIContext
-
-# Import Alembic
-from alembic.config import Config
-from alembic import command
 
 def create_migration():
     """Create initial migration."""
+    # Import all models to ensure they're registered. Deferred until the
+    # migration is actually generated so importing this module stays cheap.
+    from backend.src.models.base import Base
+    from backend.src.models.user import User
+    from backend.src.models.organization import Organization
+    from backend.src.models.project import Project
+    from backend.src.models.story import Story
+    from backend.src.models.document import Document
+    from backend.src.models.integration import Integration
+    from backend.src.models.analytics import AnalyticsEvent
+    from backend.src.models.ai_context import AIContext
+
+    # Import Alembic
+    from alembic.config import Config
+    from alembic import command
+
     # Get alembic config
     alembic_cfg = Config(str(backend_dir / "alembic.ini"))
     
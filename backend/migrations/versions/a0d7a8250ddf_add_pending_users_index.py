@@ -0,0 +1,39 @@
+"""Add partial index on pending users
+
+Revision ID: a0d7a8250ddf
+Revises:
+Create Date: 2026-10-16 18:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a0d7a8250ddf'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade database schema."""
+    # Fresh databases get the index from the model via create_all
+    if not sa.inspect(op.get_bind()).has_table("users"):
+        return
+
+    # CONCURRENTLY avoids locking users against writes, but cannot run
+    # inside a transaction
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_user_pending_created "
+            "ON users (created_at) WHERE status = 'pending'"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade database schema."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_user_pending_created")
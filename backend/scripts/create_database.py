@@ -31,23 +31,26 @@ async def create_database():
         port=db_url.port or 5432,
         user=db_url.username,
         password=db_url.password,
-        database='postgres'
+        database='postgres',
+        # Single statement, nothing worth caching
+        statement_cache_size=0,
     )
     
     try:
-        # Check if database exists
+        # Let Postgres report a collision instead of checking pg_database first
+        await conn.execute(f'CREATE DATABASE "{db_url.database}"')
+        logger.info(f"Database '{db_url.database}' created successfully")
+    except asyncpg.exceptions.DuplicateDatabaseError:
+        logger.info(f"Database '{db_url.database}' already exists")
+    except asyncpg.exceptions.InsufficientPrivilegeError:
+        # Roles without CREATEDB are refused before the name is checked
         exists = await conn.fetchval(
-            "SELECT EXISTS(SELECT 1 FROM pg_database WHERE datname = $1)",
-            db_url.database
+            "SELECT 1 FROM pg_database WHERE datname = $1",
+            db_url.database,
         )
-        
         if not exists:
-            # Create the database
-            await conn.execute(f'CREATE DATABASE "{db_url.database}"')
-            logger.info(f"Database '{db_url.database}' created successfully")
-        else:
-            logger.info(f"Database '{db_url.database}' already exists")
-            
+            raise
+        logger.info(f"Database '{db_url.database}' already exists")
     except Exception as e:
         logger.error(f"Error creating database: {e}")
         raise
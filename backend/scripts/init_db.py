@@ -3,138 +3,184 @@ Initialize database with default data.
 """
 
 import asyncio
+import os
 from datetime import datetime
+from typing import Any, Callable
 
-from sqlalchemy import select, func
+from sqlalchemy import insert, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.src.core.database import engine, AsyncSessionLocal
-from backend.src.core.security import get_password_hash
+from backend.src.core.security import pwd_context
 from backend.src.models.base import Base
-from backend.src.models.user import User, Organization, Role, Permission
+from backend.src.models.organization import Organization, OrganizationMember, OrganizationPlan
+from backend.src.models.user import (
+    User, UserStatus, Role, Permission, role_permissions, user_roles
+)
 from backend.src.core.logging import setup_logging, get_logger
 
 logger = get_logger(__name__)
 
+# Demo accounts are development-only, so allow a cheaper bcrypt cost to speed
+# up repeated local/CI resets. Never use this context for real user passwords.
+seed_pwd_context = pwd_context.copy(
+    bcrypt__rounds=int(os.getenv("DEV_BCRYPT_ROUNDS", "12"))
+)
 
-async def create_default_roles_and_permissions(session: AsyncSession) -> None:
-    """Create default roles and permissions."""
-    # Create permissions
-    permissions = [
-        # Stories
-        {"name": "stories.create", "display_name": "Create Stories", "resource": "stories", "action": "create"},
-        {"name": "stories.read", "display_name": "Read Stories", "resource": "stories", "action": "read"},
-        {"name": "stories.edit", "display_name": "Edit Stories", "resource": "stories", "action": "edit"},
-        {"name": "stories.delete", "display_name": "Delete Stories", "resource": "stories", "action": "delete"},
-        # Documents
-        {"name": "documents.create", "display_name": "Create Documents", "resource": "documents", "action": "create"},
-        {"name": "documents.read", "display_name": "Read Documents", "resource": "documents", "action": "read"},
-        {"name": "documents.edit", "display_name": "Edit Documents", "resource": "documents", "action": "edit"},
-        {"name": "documents.delete", "display_name": "Delete Documents", "resource": "documents", "action": "delete"},
-        # Analytics
-        {"name": "analytics.view", "display_name": "View Analytics", "resource": "analytics", "action": "view"},
-        # Users
-        {"name": "users.manage", "display_name": "Manage Users", "resource": "users", "action": "manage"},
-        # Organization
-        {"name": "organization.manage", "display_name": "Manage Organization", "resource": "organization", "action": "manage"},
-        # Integrations
-        {"name": "integrations.manage", "display_name": "Manage Integrations", "resource": "integrations", "action": "manage"},
-    ]
-    
-    created_permissions = []
-    for perm_data in permissions:
-        permission = Permission(**perm_data)
-        session.add(permission)
-        created_permissions.append(permission)
-    
-    await session.flush()
-    
-    # Create roles
-    roles = [
+
+# Default permissions seeded on first start
+_PERMISSION_SEED: tuple[dict[str, str], ...] = (
+    # Stories
+    {"name": "stories.create", "display_name": "Create Stories", "resource": "stories", "action": "create"},
+    {"name": "stories.read", "display_name": "Read Stories", "resource": "stories", "action": "read"},
+    {"name": "stories.edit", "display_name": "Edit Stories", "resource": "stories", "action": "edit"},
+    {"name": "stories.delete", "display_name": "Delete Stories", "resource": "stories", "action": "delete"},
+    # Documents
+    {"name": "documents.create", "display_name": "Create Documents", "resource": "documents", "action": "create"},
+    {"name": "documents.read", "display_name": "Read Documents", "resource": "documents", "action": "read"},
+    {"name": "documents.edit", "display_name": "Edit Documents", "resource": "documents", "action": "edit"},
+    {"name": "documents.delete", "display_name": "Delete Documents", "resource": "documents", "action": "delete"},
+    # Analytics
+    {"name": "analytics.view", "display_name": "View Analytics", "resource": "analytics", "action": "view"},
+    # Users
+    {"name": "users.manage", "display_name": "Manage Users", "resource": "users", "action": "manage"},
+    # Organization
+    {"name": "organization.manage", "display_name": "Manage Organization", "resource": "organization", "action": "manage"},
+    # Integrations
+    {"name": "integrations.manage", "display_name": "Manage Integrations", "resource": "integrations", "action": "manage"},
+)
+
+# Default roles, each with a selector picking its share of _PERMISSION_SEED
+_ROLE_SEED: tuple[tuple[dict[str, Any], Callable[[Any], bool]], ...] = (
+    (
         {
             "name": "admin",
             "display_name": "Administrator",
             "description": "Full system access",
             "is_system": True,
-            "permissions": created_permissions  # All permissions
         },
+        lambda p: True,  # All permissions
+    ),
+    (
         {
             "name": "product_manager",
             "display_name": "Product Manager",
             "description": "Can manage stories and documents",
             "is_system": True,
-            "permissions": [p for p in created_permissions if p.resource in ["stories", "documents", "analytics"]]
         },
+        lambda p: p.resource in ("stories", "documents", "analytics"),
+    ),
+    (
         {
             "name": "developer",
             "display_name": "Developer",
             "description": "Can view stories and documents",
             "is_system": True,
-            "permissions": [p for p in created_permissions if p.action == "read" or p.resource == "analytics"]
         },
+        lambda p: p.action == "read" or p.resource == "analytics",
+    ),
+    (
         {
             "name": "viewer",
             "display_name": "Viewer",
             "description": "Read-only access",
             "is_system": True,
-            "permissions": [p for p in created_permissions if p.action == "read"]
-        }
-    ]
-    
-    for role_data in roles:
-        permissions = role_data.pop("permissions")
-        role = Role(**role_data)
-        role.permissions.extend(permissions)
-        session.add(role)
-    
-    await session.commit()
-    logger.info("default_roles_created", count=len(roles))
+        },
+        lambda p: p.action == "read",
+    ),
+)
 
 
-async def create_demo_organization_and_user(session: AsyncSession) -> None:
-    """Create demo organization and admin user."""
-    # Create organization
-    org = Organization(
-        name="Demo Organization",
-        slug="demo-org",
-        description="Demo organization for testing PRISM",
-        tier="free",
-        max_users=10,
-        max_projects=3,
-        max_ai_requests_per_month=1000,
+async def create_default_roles_and_permissions(session: AsyncSession) -> None:
+    """Create default roles and permissions."""
+    # Insert all permissions in one statement, keeping the generated ids
+    result = await session.execute(
+        insert(Permission).returning(
+            Permission.id,
+            Permission.resource,
+            Permission.action,
+            sort_by_parameter_order=True,
+        ),
+        list(_PERMISSION_SEED),
     )
-    session.add(org)
-    await session.flush()
-    
-    # Create admin user
-    result = await session.execute(select(Role).filter_by(name="admin"))
-    admin_role = result.scalar_one()
+    created_permissions = result.all()
     
-    user = User(
-        email="admin@demo.local",
-        username="admin",
-        password_hash=get_password_hash("admin123"),
-        full_name="Demo Admin",
-        status="active",
-        email_verified=True,
-        email_verified_at=datetime.utcnow(),
+    # Create roles
+    result = await session.execute(
+        insert(Role).returning(Role.id, sort_by_parameter_order=True),
+        [role_data for role_data, _ in _ROLE_SEED],
     )
-    user.roles.append(admin_role)
-    session.add(user)
-    await session.flush()
+    role_ids = result.scalars().all()
     
-    # Add user to organization
-    from backend.src.models.user import UserOrganization
-    user_org = UserOrganization(
-        user_id=user.id,
-        organization_id=org.id,
-        role="owner",
-        is_primary=True,
+    # Link roles to permissions with a single multi-row insert
+    await session.execute(
+        insert(role_permissions),
+        [
+            {"role_id": role_id, "permission_id": permission.id}
+            for role_id, (_, selector) in zip(role_ids, _ROLE_SEED)
+            for permission in created_permissions
+            if selector(permission)
+        ],
     )
-    session.add(user_org)
     
     await session.commit()
-    logger.info("demo_data_created", org=org.slug, user=user.email)
+    logger.info("default_roles_created", count=len(_ROLE_SEED))
+
+
+async def create_demo_organization_and_user(session: AsyncSession) -> None:
+    """Create demo organization and admin user."""
+    async with session.begin():
+        # Create admin user, getting its id back without a flush
+        result = await session.execute(
+            insert(User)
+            .values(
+                email="admin@demo.local",
+                username="admin",
+                password_hash=seed_pwd_context.hash("admin123"),
+                full_name="Demo Admin",
+                status=UserStatus.active,
+                email_verified=True,
+                email_verified_at=datetime.utcnow(),
+            )
+            .returning(User.id)
+        )
+        user_id = result.scalar_one()
+        
+        # Grant the admin role, resolving its id inside the same statement
+        await session.execute(
+            insert(user_roles).values(
+                user_id=user_id,
+                role_id=select(Role.id).where(Role.name == "admin").scalar_subquery(),
+            )
+        )
+        
+        # Create organization owned by the admin
+        result = await session.execute(
+            insert(Organization)
+            .values(
+                name="Demo Organization",
+                slug="demo-org",
+                description="Demo organization for testing PRISM",
+                email="admin@demo.local",
+                plan=OrganizationPlan.FREE,
+                max_users=10,
+                max_projects=3,
+                owner_id=user_id,
+            )
+            .returning(Organization.id)
+        )
+        org_id = result.scalar_one()
+        
+        # Add user to organization
+        await session.execute(
+            insert(OrganizationMember).values(
+                user_id=user_id,
+                organization_id=org_id,
+                role="owner",
+            )
+        )
+    
+    logger.info("demo_data_created", org="demo-org", user="admin@demo.local")
 
 
 async def init_db() -> None:
@@ -4,11 +4,18 @@ Provides common functionality and interfaces.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, TypeVar, Generic
-from datetime import datetime
+import asyncio
+import contextvars
+import copy
+import functools
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, TypeVar, Generic, Union
 import hashlib
-import json
+import re
+import threading
+import time
+import unicodedata
 
+import orjson
 from pydantic import BaseModel, Field
 from langchain.chat_models.base import BaseChatModel
 from langchain_openai import ChatOpenAI
@@ -24,6 +31,126 @@ from backend.src.core.monitoring import track_llm_request, track_agent_execution
 logger = get_logger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# LLM clients shared by agents with identical settings, so each provider
+# connection pool is created once per process rather than once per agent
+_llm_cache: Dict[tuple, BaseChatModel] = {}
+_llm_cache_lock = threading.Lock()
+
+# Cache reads slower than this fall through to processing
+CACHE_READ_TIMEOUT = 0.05
+
+# Strong references to in-flight cache writes until they complete
+_background_tasks: set[asyncio.Task] = set()
+
+# Default cap on concurrent LLM calls per agent
+DEFAULT_MAX_CONCURRENCY = 5
+
+# Token usage of the execute() call running in the current task; generate()
+# adds each LLM call's counts here
+_token_usage: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar(
+    "agent_token_usage", default=None
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _llm_config(provider: str) -> Dict[str, Any]:
+    """
+    Get LLM settings for a provider, read once per process.
+    
+    The returned dict is shared between agents and must not be mutated.
+    """
+    return dict(settings.get_llm_config(provider))
+
+
+async def run_concurrently(aws: Iterable[Awaitable[R]]) -> List[R]:
+    """
+    Run awaitables concurrently, cancelling the rest as soon as one fails.
+    
+    Unlike a bare asyncio.gather, a failure does not leave sibling LLM calls
+    running, and spending tokens, after their results are already lost.
+    
+    Args:
+        aws: Awaitables to run
+        
+    Returns:
+        Results, in the same order as aws
+        
+    Raises:
+        Exception: The first exception raised by any awaitable
+    """
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(aw) for aw in aws]
+    except ExceptionGroup as errors:
+        raise errors.exceptions[0] from None
+    
+    return [task.result() for task in tasks]
+
+
+# Orjson options giving a deterministic byte form for cache keys
+_CACHE_KEY_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def prompt_json(value: Any) -> str:
+    """
+    Render data as indented JSON for inclusion in a prompt.
+    
+    Keys are sorted so the same data always renders to the same bytes,
+    which keeps provider prompt-prefix caches hitting.
+    """
+    return orjson.dumps(
+        value,
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+    ).decode()
+
+
+# JSON payload inside a markdown fence, or a bare object/array amid prose
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*(\{.*\}|\[.*\])\s*```", re.DOTALL)
+_JSON_BODY_RE = re.compile(r"\{.*\}|\[.*\]", re.DOTALL)
+
+
+def extract_json(response: str) -> str:
+    """
+    Extract the JSON payload from an LLM response.
+    
+    Strips markdown code fences and any prose before or after the payload,
+    so the result can go straight to a pydantic validate_json call.
+    """
+    match = _JSON_FENCE_RE.search(response)
+    if match:
+        return match.group(1)
+    match = _JSON_BODY_RE.search(response)
+    return match.group(0) if match else response.strip()
+
+
+def _canonicalize(value: Any) -> Any:
+    """
+    Normalize input data so semantically equal inputs hash identically.
+    
+    Floats are rounded to 9 places, strings are NFC-normalized, pydantic
+    models are dumped to plain data, and lists under keys ending in ``_set``
+    are treated as unordered.
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump(mode="json")
+    
+    if isinstance(value, dict):
+        canonical = {}
+        for key, item in value.items():
+            item = _canonicalize(item)
+            if isinstance(key, str) and key.endswith("_set") and isinstance(item, list):
+                item.sort(key=lambda i: orjson.dumps(i, option=_CACHE_KEY_OPTIONS))
+            canonical[key] = item
+        return canonical
+    if isinstance(value, (list, tuple)):
+        return [_canonicalize(item) for item in value]
+    if isinstance(value, float):
+        return round(value, 9)
+    if isinstance(value, str):
+        return unicodedata.normalize("NFC", value)
+    return value
 
 
 class AgentError(Exception):
@@ -47,25 +174,29 @@ class AgentResult(BaseModel):
 class AgentCallbackHandler(AsyncCallbackHandler):
     """Callback handler for tracking agent metrics."""
     
+    __slots__ = ("agent_type", "start_time", "prompt_tokens", "completion_tokens")
+    
     def __init__(self, agent_type: str):
         self.agent_type = agent_type
         self.start_time = None
-        self.tokens = {"prompt": 0, "completion": 0}
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
     
     async def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs) -> None:
         """Called when LLM starts."""
-        self.start_time = datetime.utcnow()
+        self.start_time = time.perf_counter()
     
     async def on_llm_end(self, response: Any, **kwargs) -> None:
         """Called when LLM ends."""
         if self.start_time:
-            duration = (datetime.utcnow() - self.start_time).total_seconds()
+            duration = time.perf_counter() - self.start_time
             
             # Extract token usage if available
-            if hasattr(response, "llm_output") and response.llm_output:
-                token_usage = response.llm_output.get("token_usage", {})
-                self.tokens["prompt"] = token_usage.get("prompt_tokens", 0)
-                self.tokens["completion"] = token_usage.get("completion_tokens", 0)
+            llm_output = getattr(response, "llm_output", None)
+            if llm_output:
+                token_usage = llm_output.get("token_usage") or {}
+                self.prompt_tokens = token_usage.get("prompt_tokens", 0)
+                self.completion_tokens = token_usage.get("completion_tokens", 0)
             
             # Track metrics
             track_llm_request(
@@ -73,14 +204,17 @@ class AgentCallbackHandler(AsyncCallbackHandler):
                 model=settings.DEFAULT_LLM_MODEL,
                 status="success",
                 duration=duration,
-                prompt_tokens=self.tokens["prompt"],
-                completion_tokens=self.tokens["completion"],
+                prompt_tokens=self.prompt_tokens,
+                completion_tokens=self.completion_tokens,
             )
 
 
 class BaseAgent(ABC, Generic[T]):
     """Base class for all AI agents."""
     
+    # Result model used to rebuild cached results; None returns raw cached data
+    output_model: Optional[type[BaseModel]] = None
+    
     def __init__(
         self,
         name: str,
@@ -89,6 +223,7 @@ class BaseAgent(ABC, Generic[T]):
         llm_model: Optional[str] = None,
         temperature: Optional[float] = None,
         cache_ttl: Optional[int] = 3600,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """
         Initialize base agent.
@@ -100,6 +235,7 @@ class BaseAgent(ABC, Generic[T]):
             llm_model: LLM model to use
             temperature: Temperature for generation
             cache_ttl: Cache TTL in seconds
+            max_concurrency: Maximum in-flight LLM calls for this agent
         """
         self.name = name
         self.description = description
@@ -107,18 +243,44 @@ class BaseAgent(ABC, Generic[T]):
         self.llm_model = llm_model or settings.DEFAULT_LLM_MODEL
         self.temperature = temperature or settings.LLM_TEMPERATURE
         self.cache_ttl = cache_ttl
+        self.max_concurrency = max_concurrency
+        
+        # Bounds concurrent LLM calls so fan-out stays within provider rate limits
+        self._llm_semaphore = asyncio.Semaphore(max_concurrency)
+        
+        # With caching disabled, bind no-ops so execute() skips the cache paths
+        if not cache_ttl or cache_ttl <= 0:
+            self._generate_cache_key = self._noop_cache_key
+            self._get_from_cache = self._noop_get
+            self._cache_snapshot = self._noop_snapshot
+            self._save_to_cache = self._noop_save
         
         # Initialize LLM
         self.llm = self._create_llm()
-        
-        # Set up callback handler
-        self.callback_handler = AgentCallbackHandler(self.name)
     
     def _create_llm(self) -> BaseChatModel:
-        """Create LLM instance based on provider."""
-        config = settings.get_llm_config(self.llm_provider)
-        config["temperature"] = self.temperature
+        """Get LLM instance for this agent, reusing a matching shared client."""
+        config = _llm_config(self.llm_provider)
+        key = (
+            self.llm_provider,
+            self.llm_model,
+            self.temperature,
+            config.get("max_tokens"),
+            config.get("timeout"),
+            config.get("base_url"),
+        )
         
+        llm = _llm_cache.get(key)
+        if llm is None:
+            with _llm_cache_lock:
+                llm = _llm_cache.get(key)
+                if llm is None:
+                    llm = self._build_llm(config)
+                    _llm_cache[key] = llm
+        return llm
+    
+    def _build_llm(self, config: Dict[str, Any]) -> BaseChatModel:
+        """Create LLM instance based on provider."""
         if self.llm_provider == "openai":
             return ChatOpenAI(
                 model=self.llm_model,
@@ -143,36 +305,66 @@ class BaseAgent(ABC, Generic[T]):
     def _generate_cache_key(self, input_data: Dict[str, Any]) -> str:
         """Generate cache key for input data."""
         # Create stable hash of input
-        input_str = json.dumps(input_data, sort_keys=True)
-        input_hash = hashlib.md5(input_str.encode()).hexdigest()
+        payload = orjson.dumps(
+            _canonicalize(input_data), option=_CACHE_KEY_OPTIONS
+        )
+        input_hash = hashlib.blake2b(payload, digest_size=16).hexdigest()
         return agent_cache_key(self.name, input_hash)
     
     async def _get_from_cache(self, cache_key: str) -> Optional[Any]:
         """Get result from cache."""
-        if self.cache_ttl <= 0:
-            return None
-        
         try:
-            cached_result = await cache.get(cache_key)
+            cached_result = await asyncio.wait_for(
+                cache.get(cache_key), timeout=CACHE_READ_TIMEOUT
+            )
             if cached_result:
                 logger.debug("agent_cache_hit", agent=self.name, key=cache_key)
+                if self.output_model is not None:
+                    return self.output_model.model_validate(cached_result)
                 return cached_result
+        except asyncio.TimeoutError:
+            logger.debug("agent_cache_timeout", agent=self.name, key=cache_key)
         except Exception as e:
             logger.warning("agent_cache_error", agent=self.name, error=str(e))
         
         return None
     
-    async def _save_to_cache(self, cache_key: str, result: Any) -> None:
-        """Save result to cache."""
-        if self.cache_ttl <= 0:
-            return
+    def _cache_snapshot(self, result: Any) -> Any:
+        """
+        Copy a result into the plain data written to the cache.
         
+        Taken before the result is returned, so later caller mutations do
+        not leak into the cached copy.
+        """
+        # The cache stores JSON, so models are dumped to plain data
+        if isinstance(result, BaseModel):
+            return result.model_dump(mode="json")
+        return copy.deepcopy(result)
+    
+    async def _save_to_cache(self, cache_key: str, result: Any) -> None:
+        """Save a cache snapshot of a result."""
         try:
             await cache.set(cache_key, result, ttl=self.cache_ttl)
             logger.debug("agent_cache_saved", agent=self.name, key=cache_key)
         except Exception as e:
             logger.warning("agent_cache_save_error", agent=self.name, error=str(e))
     
+    def _noop_cache_key(self, input_data: Dict[str, Any]) -> str:
+        """Skip key hashing when caching is disabled."""
+        return ""
+    
+    async def _noop_get(self, cache_key: str) -> None:
+        """Cache lookup used when caching is disabled."""
+        return None
+    
+    def _noop_snapshot(self, result: Any) -> None:
+        """Skip copying results when caching is disabled."""
+        return None
+    
+    async def _noop_save(self, cache_key: str, result: Any) -> None:
+        """Cache write used when caching is disabled."""
+        return None
+    
     @abstractmethod
     async def _process(self, input_data: Dict[str, Any]) -> T:
         """
@@ -209,7 +401,9 @@ class BaseAgent(ABC, Generic[T]):
         Returns:
             Agent execution result
         """
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
+        usage = {"prompt": 0, "completion": 0}
+        usage_token = _token_usage.set(usage)
         
         try:
             # Validate input
@@ -220,7 +414,7 @@ class BaseAgent(ABC, Generic[T]):
             cached_result = await self._get_from_cache(cache_key)
             
             if cached_result:
-                execution_time = (datetime.utcnow() - start_time).total_seconds()
+                execution_time = time.perf_counter() - start_time
                 track_agent_execution(self.name, "cache_hit", execution_time)
                 
                 return AgentResult(
@@ -234,11 +428,15 @@ class BaseAgent(ABC, Generic[T]):
             # Process input
             result = await self._process(input_data)
             
-            # Save to cache
-            await self._save_to_cache(cache_key, result)
+            # Snapshot now, since the caller may mutate result before the
+            # write runs; save off the critical path, errors are logged inside
+            snapshot = self._cache_snapshot(result)
+            task = asyncio.create_task(self._save_to_cache(cache_key, snapshot))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
             
             # Calculate execution time
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             # Track metrics
             track_agent_execution(self.name, "success", execution_time)
@@ -248,14 +446,11 @@ class BaseAgent(ABC, Generic[T]):
                 data=result,
                 execution_time=execution_time,
                 model_used=self.llm_model,
-                tokens_used={
-                    "prompt": self.callback_handler.tokens["prompt"],
-                    "completion": self.callback_handler.tokens["completion"],
-                },
+                tokens_used=usage,
             )
             
         except Exception as e:
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            execution_time = time.perf_counter() - start_time
             
             logger.error(
                 "agent_execution_failed",
@@ -273,32 +468,49 @@ class BaseAgent(ABC, Generic[T]):
                 execution_time=execution_time,
                 model_used=self.llm_model,
             )
+        
+        finally:
+            _token_usage.reset(usage_token)
+    
+    def prompt_block(self, text: str, cache: bool = False) -> Dict[str, Any]:
+        """
+        Build a text content block for a multipart prompt.
+        
+        Args:
+            text: Block text
+            cache: Whether the block is static and worth caching provider-side
+            
+        Returns:
+            Content block dict
+        """
+        block = {"type": "text", "text": text}
+        # OpenAI caches repeated prefixes automatically; Anthropic needs a marker
+        if cache and self.llm_provider == "anthropic":
+            block["cache_control"] = {"type": "ephemeral"}
+        return block
     
     def create_messages(
         self,
-        system_prompt: str,
-        user_prompt: str,
+        system_prompt: Union[str, List[Dict[str, Any]]],
+        user_prompt: Union[str, List[Dict[str, Any]]],
         history: Optional[List[BaseMessage]] = None,
     ) -> List[BaseMessage]:
         """
         Create message list for LLM.
         
         Args:
-            system_prompt: System prompt
-            user_prompt: User prompt
+            system_prompt: System prompt, as a string or content blocks
+            user_prompt: User prompt, as a string or content blocks
             history: Optional conversation history
             
         Returns:
             List of messages
         """
-        messages = [SystemMessage(content=system_prompt)]
-        
-        if history:
-            messages.extend(history)
-        
-        messages.append(HumanMessage(content=user_prompt))
-        
-        return messages
+        return [
+            SystemMessage(content=system_prompt),
+            *(history or ()),
+            HumanMessage(content=user_prompt),
+        ]
     
     async def generate(
         self,
@@ -315,10 +527,18 @@ class BaseAgent(ABC, Generic[T]):
         Returns:
             Generated response
         """
-        response = await self.llm.ainvoke(
-            messages,
-            callbacks=[self.callback_handler],
-            **kwargs
-        )
+        # One handler per call, since concurrent calls would race on its state
+        handler = AgentCallbackHandler(self.name)
+        async with self._llm_semaphore:
+            response = await self.llm.ainvoke(
+                messages,
+                callbacks=[handler],
+                **kwargs
+            )
+        
+        usage = _token_usage.get()
+        if usage is not None:
+            usage["prompt"] += handler.prompt_tokens
+            usage["completion"] += handler.completion_tokens
         
         return response.content
\ No newline at end of file
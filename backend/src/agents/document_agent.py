@@ -3,15 +3,18 @@ Document Agent for generating various types of documentation.
 Creates PRDs, technical specs, and other product documentation.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from enum import Enum
-import json
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter
 from langchain.output_parsers import PydanticOutputParser
+from langchain.output_parsers.format_instructions import PYDANTIC_FORMAT_INSTRUCTIONS
 from langchain.prompts import PromptTemplate
 
-from backend.src.agents.base import BaseAgent, AgentError
+from backend.src.agents.base import (
+    BaseAgent, AgentError, extract_json, prompt_json, run_concurrently
+)
 from backend.src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -44,6 +47,52 @@ class DocumentOutput(BaseModel):
 # Allow recursive model
 DocumentSection.model_rebuild()
 
+# Validators built at import so the recursive schema is compiled once
+_DOCUMENT_ADAPTER = TypeAdapter(DocumentOutput)
+_SECTION_ADAPTER = TypeAdapter(DocumentSection)
+
+# Subsection depth described to the LLM; parsing still accepts deeper nesting
+MAX_SECTION_DEPTH = 2
+
+
+def _format_instructions(max_depth: int = MAX_SECTION_DEPTH) -> str:
+    """
+    Render document format instructions with section nesting bounded.
+    
+    The recursive DocumentSection schema stays a compact $ref, followed by a
+    one-line note capping how deep subsections may nest.
+    
+    Args:
+        max_depth: Levels of subsections below top-level sections
+        
+    Returns:
+        Format instructions string
+    """
+    schema = DocumentOutput.model_json_schema()
+    
+    # Titles only restate the model and field names, so leave them out
+    for model_schema in (schema, *schema["$defs"].values()):
+        model_schema.pop("title", None)
+        for prop in model_schema["properties"].values():
+            prop.pop("title", None)
+    # Match PydanticOutputParser, which drops this top-level key
+    schema.pop("type", None)
+    
+    instructions = PYDANTIC_FORMAT_INSTRUCTIONS.format(
+        schema=orjson.dumps(schema).decode()
+    )
+    return (
+        f"{instructions}\n"
+        f"Nest subsections at most {max_depth} levels below top-level sections."
+    )
+
+
+# Rendered once at import; the prompt text never changes at runtime
+_FORMAT_INSTRUCTIONS = _format_instructions()
+
+# Markdown heading prefixes indexed by level
+_HEADINGS = tuple("#" * level for level in range(8))
+
 
 class DocumentType(str, Enum):
     """Supported document types."""
@@ -55,9 +104,91 @@ class DocumentType(str, Enum):
     RETROSPECTIVE = "retrospective"
 
 
+# Valid document type strings, for O(1) input validation
+_DOC_TYPE_VALUES = frozenset(t.value for t in DocumentType)
+
+# Section templates per document type
+_PRD_SECTIONS = (
+    "Executive Summary",
+    "Problem Statement",
+    "Goals and Objectives",
+    "User Personas",
+    "User Stories and Use Cases",
+    "Functional Requirements",
+    "Non-Functional Requirements",
+    "Success Metrics",
+    "Timeline and Milestones",
+    "Risks and Mitigations",
+    "Open Questions",
+)
+
+_TECH_SPEC_SECTIONS = (
+    "Overview",
+    "Architecture",
+    "Technology Stack",
+    "API Design",
+    "Data Models",
+    "Security Considerations",
+    "Performance Requirements",
+    "Testing Strategy",
+    "Deployment Plan",
+    "Monitoring and Observability",
+)
+
+_DESIGN_DOC_SECTIONS = (
+    "Context and Scope",
+    "Goals and Non-Goals",
+    "Proposed Solution",
+    "Alternative Solutions",
+    "System Design",
+    "Implementation Details",
+    "Testing Plan",
+    "Rollout Strategy",
+    "Future Considerations",
+)
+
+_USER_GUIDE_SECTIONS = (
+    "Introduction",
+    "Getting Started",
+    "Core Features",
+    "Advanced Features",
+    "Use Cases and Examples",
+    "Troubleshooting",
+    "FAQ",
+    "Best Practices",
+    "Support and Resources",
+)
+
+_TEMPLATES = {
+    DocumentType.PRD: _PRD_SECTIONS,
+    DocumentType.TECH_SPEC: _TECH_SPEC_SECTIONS,
+    DocumentType.DESIGN_DOC: _DESIGN_DOC_SECTIONS,
+    DocumentType.USER_GUIDE: _USER_GUIDE_SECTIONS,
+}
+
+# Templates rendered for prompts once, at import
+_TEMPLATE_JSON = {
+    doc_type: prompt_json(sections) for doc_type, sections in _TEMPLATES.items()
+}
+
+
+class _PRDFallbackDict(dict):
+    """
+    Per-document-type lookup that falls back to the PRD entry.
+    
+    DocumentType is a str enum, so plain type strings hit the enum keys
+    directly without constructing a member.
+    """
+    
+    def __missing__(self, key: str) -> Any:
+        return self[DocumentType.PRD]
+
+
 class DocumentAgent(BaseAgent[DocumentOutput]):
     """Agent for generating documentation."""
     
+    output_model = DocumentOutput
+    
     def __init__(self, **kwargs):
         """Initialize document agent."""
         super().__init__(
@@ -108,72 +239,30 @@ class DocumentAgent(BaseAgent[DocumentOutput]):
             - Best practices""",
         }
         
-        # Document templates
-        self.templates = {
-            DocumentType.PRD: self._get_prd_template(),
-            DocumentType.TECH_SPEC: self._get_tech_spec_template(),
-            DocumentType.DESIGN_DOC: self._get_design_doc_template(),
-            DocumentType.USER_GUIDE: self._get_user_guide_template(),
-        }
-    
-    def _get_prd_template(self) -> List[str]:
-        """Get PRD section template."""
-        return [
-            "Executive Summary",
-            "Problem Statement",
-            "Goals and Objectives",
-            "User Personas",
-            "User Stories and Use Cases",
-            "Functional Requirements",
-            "Non-Functional Requirements",
-            "Success Metrics",
-            "Timeline and Milestones",
-            "Risks and Mitigations",
-            "Open Questions",
-        ]
-    
-    def _get_tech_spec_template(self) -> List[str]:
-        """Get technical specification template."""
-        return [
-            "Overview",
-            "Architecture",
-            "Technology Stack",
-            "API Design",
-            "Data Models",
-            "Security Considerations",
-            "Performance Requirements",
-            "Testing Strategy",
-            "Deployment Plan",
-            "Monitoring and Observability",
-        ]
-    
-    def _get_design_doc_template(self) -> List[str]:
-        """Get design document template."""
-        return [
-            "Context and Scope",
-            "Goals and Non-Goals",
-            "Proposed Solution",
-            "Alternative Solutions",
-            "System Design",
-            "Implementation Details",
-            "Testing Plan",
-            "Rollout Strategy",
-            "Future Considerations",
-        ]
-    
-    def _get_user_guide_template(self) -> List[str]:
-        """Get user guide template."""
-        return [
-            "Introduction",
-            "Getting Started",
-            "Core Features",
-            "Advanced Features",
-            "Use Cases and Examples",
-            "Troubleshooting",
-            "FAQ",
-            "Best Practices",
-            "Support and Resources",
-        ]
+        # Document templates, shared by all instances
+        self.templates = _TEMPLATES
+        
+        # Static prompt blocks per document type, sent ahead of the
+        # per-request details so provider prompt caches can reuse them
+        self._format_instructions = _FORMAT_INSTRUCTIONS
+        self._template_json = _TEMPLATE_JSON
+        self._system_blocks = _PRDFallbackDict({
+            doc_type: [self.prompt_block(prompt, cache=True)]
+            for doc_type, prompt in self.system_prompts.items()
+        })
+        self._template_for = _PRDFallbackDict(self.templates)
+        self._template_blocks = _PRDFallbackDict({
+            doc_type: self.prompt_block(
+                f"""Please structure the document with these sections:
+{template_json}
+
+Provide detailed content for each section. Use markdown formatting for better readability.
+
+{self._format_instructions}""",
+                cache=True,
+            )
+            for doc_type, template_json in self._template_json.items()
+        })
     
     def _validate_input(self, input_data: Dict[str, Any]) -> None:
         """Validate input data."""
@@ -184,7 +273,7 @@ class DocumentAgent(BaseAgent[DocumentOutput]):
             raise AgentError("Document type is required")
         
         doc_type = input_data["type"]
-        if doc_type not in [t.value for t in DocumentType]:
+        if doc_type not in _DOC_TYPE_VALUES:
             raise AgentError(f"Unsupported document type: {doc_type}")
         
         if not input_data.get("context"):
@@ -200,17 +289,11 @@ class DocumentAgent(BaseAgent[DocumentOutput]):
         audience = input_data.get("audience", "General audience")
         
         # Get appropriate system prompt and template
-        system_prompt = self.system_prompts.get(
-            DocumentType(doc_type),
-            self.system_prompts[DocumentType.PRD]
-        )
+        system_blocks = self._system_blocks[doc_type]
+        template_sections = self._template_for[doc_type]
+        template_block = self._template_blocks[doc_type]
         
-        template_sections = self.templates.get(
-            DocumentType(doc_type),
-            self.templates[DocumentType.PRD]
-        )
-        
-        # Create user prompt
+        # Create user prompt, static template first and request details last
         user_prompt = f"""Create a comprehensive {doc_type} document with the following details:
 
 Title: {title}
@@ -220,24 +303,20 @@ Context:
 {context}
 
 Requirements:
-{json.dumps(requirements, indent=2)}
-
-Please structure the document with these sections:
-{json.dumps(template_sections, indent=2)}
-
-Provide detailed content for each section. Use markdown formatting for better readability.
-
-{self.output_parser.get_format_instructions()}"""
+{prompt_json(requirements)}"""
         
         # Create messages
-        messages = self.create_messages(system_prompt, user_prompt)
+        messages = self.create_messages(
+            system_blocks,
+            [template_block, self.prompt_block(user_prompt)]
+        )
         
         # Generate response
         response = await self.generate(messages)
         
         # Parse response
         try:
-            document = self.output_parser.parse(response)
+            document = _DOCUMENT_ADAPTER.validate_json(extract_json(response))
             
             # Add metadata
             document.metadata.update({
@@ -263,7 +342,8 @@ Provide detailed content for each section. Use markdown formatting for better re
         self,
         doc_type: str,
         section_title: str,
-        context: Dict[str, Any]
+        context: Dict[str, Any],
+        context_block: Optional[Dict[str, Any]] = None
     ) -> DocumentSection:
         """
         Generate a specific document section.
@@ -272,20 +352,19 @@ Provide detailed content for each section. Use markdown formatting for better re
             doc_type: Document type
             section_title: Section to generate
             context: Context for generation
+            context_block: Prebuilt context block, shared across sections
             
         Returns:
             Generated section
         """
-        system_prompt = self.system_prompts.get(
-            DocumentType(doc_type),
-            self.system_prompts[DocumentType.PRD]
-        )
+        system_blocks = self._system_blocks[doc_type]
         
+        if context_block is None:
+            context_block = self._context_block(context)
+        
+        # Shared context goes first so sibling sections reuse the cached prefix
         user_prompt = f"""Generate detailed content for the "{section_title}" section of a {doc_type}.
 
-Context:
-{json.dumps(context, indent=2)}
-
 Provide comprehensive content that:
 1. Is well-structured and easy to read
 2. Includes specific details and examples
@@ -299,12 +378,14 @@ Return the section in this format:
     "subsections": []
 }}"""
         
-        messages = self.create_messages(system_prompt, user_prompt)
+        messages = self.create_messages(
+            system_blocks,
+            [context_block, self.prompt_block(user_prompt)]
+        )
         response = await self.generate(messages)
         
         try:
-            section_data = json.loads(response)
-            section = DocumentSection(**section_data)
+            section = _SECTION_ADAPTER.validate_json(extract_json(response))
             
             logger.info(
                 "section_generated",
@@ -318,6 +399,37 @@ Return the section in this format:
             logger.error("section_generation_failed", error=str(e))
             raise AgentError(f"Failed to generate section: {str(e)}")
     
+    async def generate_sections_batch(
+        self,
+        doc_type: str,
+        section_titles: List[str],
+        context: Dict[str, Any]
+    ) -> List[DocumentSection]:
+        """
+        Generate several document sections concurrently.
+        
+        Args:
+            doc_type: Document type
+            section_titles: Sections to generate
+            context: Context shared by all sections
+            
+        Returns:
+            Generated sections, in the same order as section_titles
+        """
+        context_block = self._context_block(context)
+        # One failed section cancels the rest instead of letting them run on
+        return await run_concurrently(
+            self.generate_section(doc_type, section_title, context, context_block)
+            for section_title in section_titles
+        )
+    
+    def _context_block(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Render section context as a byte-stable, cacheable prompt block."""
+        return self.prompt_block(
+            f"Context:\n{prompt_json(context)}",
+            cache=True,
+        )
+    
     async def update_document(
         self,
         document: DocumentOutput,
@@ -350,17 +462,21 @@ Return the section in this format:
                 "updates": updates,
             }
             
-            for section_title in regenerate_sections:
-                # Find and replace section
-                for i, section in enumerate(document.sections):
-                    if section.title == section_title:
-                        new_section = await self.generate_section(
-                            document.type,
-                            section_title,
-                            context
-                        )
-                        document.sections[i] = new_section
-                        break
+            # Index sections once, then regenerate the matching ones concurrently
+            title_to_idx: Dict[str, int] = {}
+            for i, section in enumerate(document.sections):
+                title_to_idx.setdefault(section.title, i)
+            titles = [
+                title for title in dict.fromkeys(regenerate_sections)
+                if title in title_to_idx
+            ]
+            new_sections = await self.generate_sections_batch(
+                document.type,
+                titles,
+                context
+            )
+            for section_title, new_section in zip(titles, new_sections):
+                document.sections[title_to_idx[section_title]] = new_section
         
         logger.info(
             "document_updated",
@@ -371,6 +487,36 @@ Return the section in this format:
         
         return document
     
+    def iter_markdown(self, document: DocumentOutput) -> Iterator[str]:
+        """
+        Render a document as markdown, one chunk per section.
+        
+        Args:
+            document: Document to convert
+            
+        Yields:
+            Markdown chunks, suitable for streaming to a file or response
+        """
+        # Start with title, metadata and summary
+        yield (
+            f"# {document.title}\n\n"
+            f"**Type:** {document.type}\n"
+            f"**Generated:** {document.metadata.get('generated_at', 'N/A')}\n\n"
+            "## Executive Summary\n\n"
+            f"{document.summary}\n\n"
+        )
+        
+        # Walk sections depth-first with an explicit stack, so deep nesting
+        # does not recurse
+        stack = [(section, 2) for section in reversed(document.sections)]
+        while stack:
+            section, level = stack.pop()
+            heading = _HEADINGS[level] if level < len(_HEADINGS) else "#" * level
+            yield f"{heading} {section.title}\n\n{section.content}\n\n"
+            stack.extend(
+                (subsection, level + 1) for subsection in reversed(section.subsections)
+            )
+    
     def to_markdown(self, document: DocumentOutput) -> str:
         """
         Convert document to markdown format.
@@ -381,27 +527,4 @@ Return the section in this format:
         Returns:
             Markdown string
         """
-        def render_section(section: DocumentSection, level: int = 2) -> str:
-            """Recursively render section."""
-            markdown = f"{'#' * level} {section.title}\n\n"
-            markdown += f"{section.content}\n\n"
-            
-            for subsection in section.subsections:
-                markdown += render_section(subsection, level + 1)
-            
-            return markdown
-        
-        # Start with title and metadata
-        markdown = f"# {document.title}\n\n"
-        markdown += f"**Type:** {document.type}\n"
-        markdown += f"**Generated:** {document.metadata.get('generated_at', 'N/A')}\n\n"
-        
-        # Add summary
-        markdown += "## Executive Summary\n\n"
-        markdown += f"{document.summary}\n\n"
-        
-        # Add sections
-        for section in document.sections:
-            markdown += render_section(section)
-        
-        return markdown
\ No newline at end of file
+        return "".join(self.iter_markdown(document))
\ No newline at end of file
@@ -4,13 +4,13 @@ Creates well-structured agile user stories with acceptance criteria.
 """
 
 from typing import Dict, Any, List, Optional
-import json
+import asyncio
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from langchain.output_parsers import PydanticOutputParser
 from langchain.prompts import PromptTemplate
 
-from backend.src.agents.base import BaseAgent, AgentError
+from backend.src.agents.base import BaseAgent, AgentError, extract_json
 from backend.src.core.logging import get_logger
 
 logger = get_logger(__name__)
@@ -46,9 +46,29 @@ class UserStoryOutput(BaseModel):
     )
 
 
+# Allowed story point values, and the nearest one for each point count up to
+# the largest (larger counts clamp to it)
+_FIBONACCI_POINTS = (1, 2, 3, 5, 8, 13)
+_NEAREST_FIBONACCI = tuple(
+    min(_FIBONACCI_POINTS, key=lambda x, points=points: abs(x - points))
+    for points in range(_FIBONACCI_POINTS[-1] + 1)
+)
+
+# Validators built at import so parsing skips per-call schema setup
+_STORY_ADAPTER = TypeAdapter(UserStoryOutput)
+_STORY_LIST_ADAPTER = TypeAdapter(List[UserStoryOutput])
+
+# Format instructions serialize the JSON schema, so render them once at import
+_FORMAT_INSTRUCTIONS = PydanticOutputParser(
+    pydantic_object=UserStoryOutput
+).get_format_instructions()
+
+
 class StoryAgent(BaseAgent[UserStoryOutput]):
     """Agent for generating user stories."""
     
+    output_model = UserStoryOutput
+    
     def __init__(self, **kwargs):
         """Initialize story agent."""
         super().__init__(
@@ -87,12 +107,19 @@ Priority: {priority}
 
 Additional Notes: {notes}
 
-{format_instructions}
-
 Generate a comprehensive user story that captures the essence of this requirement.""",
             input_variables=["requirement", "context", "target_users", "priority", "notes"],
-            partial_variables={"format_instructions": self.output_parser.get_format_instructions()}
         )
+        
+        # Format the raw template directly, skipping PromptTemplate's
+        # per-call validation and partial merging
+        self._user_prompt_raw = self.user_prompt_template.template
+        
+        # Static prompt blocks, sent ahead of the per-request details so
+        # provider prompt caches can reuse them
+        self._system_blocks = [self.prompt_block(self.system_prompt, cache=True)]
+        self._format_instructions = _FORMAT_INSTRUCTIONS
+        self._format_block = self.prompt_block(self._format_instructions, cache=True)
     
     def _validate_input(self, input_data: Dict[str, Any]) -> None:
         """Validate input data."""
@@ -115,29 +142,32 @@ Generate a comprehensive user story that captures the essence of this requiremen
         notes = input_data.get("notes", "None provided")
         
         # Format user prompt
-        user_prompt = self.user_prompt_template.format(
-            requirement=requirement,
-            context=context,
-            target_users=target_users,
-            priority=priority,
-            notes=notes
-        )
+        user_prompt = self._user_prompt_raw.format_map({
+            "requirement": requirement,
+            "context": context,
+            "target_users": target_users,
+            "priority": priority,
+            "notes": notes,
+        })
         
         # Create messages
-        messages = self.create_messages(self.system_prompt, user_prompt)
+        messages = self.create_messages(
+            self._system_blocks,
+            [self._format_block, self.prompt_block(user_prompt)]
+        )
         
         # Generate response
         response = await self.generate(messages)
         
         # Parse response
         try:
-            story = self.output_parser.parse(response)
+            story = _STORY_ADAPTER.validate_json(extract_json(response))
             
-            # Post-process story points if needed
-            if story.story_points and story.story_points not in [1, 2, 3, 5, 8, 13]:
-                # Round to nearest Fibonacci number
-                fibonacci = [1, 2, 3, 5, 8, 13]
-                story.story_points = min(fibonacci, key=lambda x: abs(x - story.story_points))
+            # Post-process story points, rounding to the nearest Fibonacci number
+            if story.story_points:
+                story.story_points = _NEAREST_FIBONACCI[
+                    max(0, min(story.story_points, _FIBONACCI_POINTS[-1]))
+                ]
             
             logger.info(
                 "story_generated",
@@ -171,9 +201,7 @@ Generate a comprehensive user story that captures the essence of this requiremen
         Returns:
             List of user stories
         """
-        stories = []
-        
-        for i in range(count):
+        def build_input(i: int) -> Dict[str, Any]:
             input_data = {
                 "requirement": requirement,
                 **kwargs
@@ -183,8 +211,16 @@ Generate a comprehensive user story that captures the essence of this requiremen
                 # Add variation instructions
                 input_data["notes"] = f"Create a different perspective or approach than previous stories. Focus on variation {i+1} of {count}."
             
-            result = await self.execute(input_data)
-            
+            return input_data
+        
+        # Stories are independent; the agent semaphore bounds the fan-out.
+        # execute() never raises, so one failed story does not cancel the rest
+        results = await asyncio.gather(
+            *(self.execute(build_input(i)) for i in range(count))
+        )
+        
+        stories = []
+        for i, result in enumerate(results):
             if result.success and result.data:
                 stories.append(result.data)
             else:
@@ -211,24 +247,35 @@ Generate a comprehensive user story that captures the essence of this requiremen
         Returns:
             Refined story
         """
-        refinement_prompt = f"""Please refine this user story based on the feedback:
-
-Original Story:
+        criteria = "\n".join(f"- {criterion}" for criterion in story.acceptance_criteria)
+        
+        # The story is fixed across refinement rounds, so it goes in a cached
+        # block ahead of the short feedback request
+        story_block = self.prompt_block(
+            f"""Original Story:
 Title: {story.title}
 As a {story.user_type}, I want {story.user_story} so that {story.benefit}
 
 Acceptance Criteria:
-{json.dumps(story.acceptance_criteria, indent=2)}
+{criteria}""",
+            cache=True,
+        )
+        feedback_block = self.prompt_block(
+            f"""Please refine this user story based on the feedback:
 
 Feedback: {feedback}
 
 Create an improved version addressing the feedback while maintaining the story structure."""
+        )
         
-        messages = self.create_messages(self.system_prompt, refinement_prompt)
+        messages = self.create_messages(
+            self._system_blocks,
+            [self._format_block, story_block, feedback_block]
+        )
         response = await self.generate(messages)
         
         try:
-            refined_story = self.output_parser.parse(response)
+            refined_story = _STORY_ADAPTER.validate_json(extract_json(response))
             
             logger.info(
                 "story_refined",
@@ -269,26 +316,19 @@ Story Points: {story.story_points}
 Please split this into 2-4 smaller stories, each with no more than {max_points} story points.
 Each story should be independently valuable and testable."""
         
-        messages = self.create_messages(self.system_prompt, split_prompt)
+        messages = self.create_messages(self._system_blocks, split_prompt)
         response = await self.generate(messages)
         
-        # Parse multiple stories from response
-        # This is a simplified version - in production, you'd use a more sophisticated parser
-        stories = []
+        # Parse a JSON array of stories, or a single story
+        payload = extract_json(response)
         try:
-            # Attempt to parse as JSON array
-            stories_data = json.loads(response)
-            for story_data in stories_data:
-                story = UserStoryOutput(**story_data)
-                stories.append(story)
-        except:
-            # Fall back to parsing single story
-            try:
-                story = self.output_parser.parse(response)
-                stories.append(story)
-            except Exception as e:
-                logger.error("story_splitting_failed", error=str(e))
-                raise AgentError(f"Failed to split story: {str(e)}")
+            if payload.startswith("["):
+                stories = _STORY_LIST_ADAPTER.validate_json(payload)
+            else:
+                stories = [_STORY_ADAPTER.validate_json(payload)]
+        except Exception as e:
+            logger.error("story_splitting_failed", error=str(e))
+            raise AgentError(f"Failed to split story: {str(e)}")
         
         logger.info(
             "story_split",
@@ -3,17 +3,27 @@ API dependencies.
 Provides common dependencies for authentication, database sessions, etc.
 """
 
-from typing import Annotated, Optional, List
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass, field
+from typing import Annotated, Dict, FrozenSet, Optional, List, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import joinedload
 
+from backend.src.core.config import settings
 from backend.src.core.database import get_db
-from backend.src.models.user import User
-from backend.src.services.auth import AuthService
+from backend.src.models.user import Role, User
+from backend.src.services.auth import (
+    AuthService,
+    CachedUser,
+    token_blacklist,
+    user_cache,
+)
 from backend.src.schemas.auth import TokenPayload
 
 # OAuth2 scheme for Swagger UI
@@ -22,26 +32,162 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 # HTTP Bearer for production use
 security = HTTPBearer()
 
+# Verified token payloads, reused briefly so repeat requests with the same
+# token skip signature verification. Keyed by a token digest, never the raw
+# token; failed decodes are not cached.
+TOKEN_CACHE_TTL = 10
+TOKEN_CACHE_MAXSIZE = 10000
 
-async def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[AsyncSession, Depends(get_db)],
-) -> User:
+# Longer bearer values are rejected without attempting a decode
+MAX_TOKEN_LENGTH = 8192
+_token_cache: Dict[bytes, Tuple[float, TokenPayload]] = {}
+
+
+async def _decode_token_cached(token: str) -> TokenPayload:
     """
-    Get current authenticated user from OAuth2 token.
+    Decode a token, reusing a recent successful decode of the same token.
     
     Args:
         token: Bearer token
+        
+    Returns:
+        Token payload
+        
+    Raises:
+        HTTPException: If the token is invalid, expired or revoked
+    """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    now = time.time()
+    
+    entry = _token_cache.get(key)
+    if entry is not None:
+        expires_at, payload = entry
+        # Revocation is re-checked on every hit
+        if expires_at > now and not (
+            payload.jti and token_blacklist.is_blacklisted(payload.jti)
+        ):
+            return payload
+        del _token_cache[key]
+    
+    if settings.JWT_ALGORITHM.startswith("HS"):
+        payload = AuthService.decode_token(token)
+    else:
+        # RSA/EC verification is CPU-bound; keep it off the event loop. The
+        # blacklist check mutates shared state, so it stays on the loop.
+        claims = await asyncio.to_thread(AuthService.verify_token_claims, token)
+        payload = AuthService.payload_from_claims(claims)
+    
+    if len(_token_cache) >= TOKEN_CACHE_MAXSIZE:
+        # Evict the oldest entry (dicts preserve insertion order)
+        del _token_cache[next(iter(_token_cache))]
+    # Never outlive the token itself
+    _token_cache[key] = (min(now + TOKEN_CACHE_TTL, payload.exp), payload)
+    return payload
+
+
+# User lookups for auth, built once and executed with a bound user_id. The
+# full variant also loads permissions and only runs on a snapshot cache miss.
+_USER_BY_ID = (
+    select(User)
+    .options(joinedload(User.roles))
+    .where(User.id == bindparam("user_id"))
+)
+_USER_WITH_PERMISSIONS_BY_ID = (
+    select(User)
+    .options(joinedload(User.roles).joinedload(Role.permissions))
+    .where(User.id == bindparam("user_id"))
+)
+
+
+async def _load_user(user_id: int, db: AsyncSession) -> Optional[User]:
+    """
+    Load a user with roles through the request session.
+    
+    The user row is always read fresh, so writes made through current_user
+    are seen by the next request. Permissions and role names come from a
+    short-lived CachedUser snapshot and are only queried on a cache miss.
+    
+    Args:
+        user_id: User ID
         db: Database session
         
     Returns:
-        Current user
+        User or None
+    """
+    cached = user_cache.get(user_id)
+    query = _USER_BY_ID if cached is not None else _USER_WITH_PERMISSIONS_BY_ID
+    result = await db.execute(query, {"user_id": user_id})
+    # Roles (and permissions) come back as one joined result set
+    user = result.unique().scalar_one_or_none()
+    
+    if user is None or not user.is_active:
+        user_cache.invalidate(user_id)
+        return user
+    if cached is None:
+        cached = CachedUser.from_user(user)
+        user_cache.set(cached)
+    
+    user._perm_cache = cached.permissions
+    user._role_names = cached.role_names
+    return user
+
+
+def _permissions(user: User) -> frozenset:
+    """
+    Get a user's permission names, computed once per user instance.
+    
+    Each request works on its own User instance, so the memo lives for
+    exactly one request.
+    
+    Args:
+        user: User to get permissions for
+        
+    Returns:
+        Permission names
+    """
+    perms = getattr(user, "_perm_cache", None)
+    if perms is None:
+        perms = frozenset(user.get_permissions())
+        user._perm_cache = perms
+    return perms
+
+
+async def _resolve_user(
+    token: str,
+    db: AsyncSession,
+    *,
+    required: bool,
+) -> Optional[User]:
+    """
+    Resolve the active user for an access token.
+    
+    Args:
+        token: Bearer token
+        db: Database session
+        required: Raise on failure instead of returning None
+        
+    Returns:
+        Current user, or None if not required and authentication fails
         
     Raises:
-        HTTPException: If authentication fails
+        HTTPException: If required and authentication fails
     """
+    if not required:
+        try:
+            return await _resolve_user(token, db, required=True)
+        except Exception:
+            return None
+    
+    # Reject anything not shaped like a JWT before any hashing or crypto
+    if token.count(".") != 2 or len(token) > MAX_TOKEN_LENGTH:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid authentication credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     # Decode token
-    token_payload = AuthService.decode_token(token)
+    token_payload = await _decode_token_cached(token)
     
     # Verify token type
     if token_payload.type != "access":
@@ -51,14 +197,9 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Get user from database with roles
+    # Get user with roles, from cache or database
     user_id = int(token_payload.sub)
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.roles))
-        .where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
+    user = await _load_user(user_id, db)
     
     if not user:
         raise HTTPException(
@@ -75,6 +216,26 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+) -> User:
+    """
+    Get current authenticated user from OAuth2 token.
+    
+    Args:
+        token: Bearer token
+        db: Database session
+        
+    Returns:
+        Current user
+        
+    Raises:
+        HTTPException: If authentication fails
+    """
+    return await _resolve_user(token, db, required=True)
+
+
 async def get_current_user_bearer(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -93,40 +254,7 @@ async def get_current_user_bearer(
     Raises:
         HTTPException: If authentication fails
     """
-    token = credentials.credentials
-    
-    # Decode token
-    token_payload = AuthService.decode_token(token)
-    
-    # Verify token type
-    if token_payload.type != "access":
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid token type"
-        )
-    
-    # Get user from database with roles
-    user_id = int(token_payload.sub)
-    result = await db.execute(
-        select(User)
-        .options(selectinload(User.roles))
-        .where(User.id == user_id)
-    )
-    user = result.scalar_one_or_none()
-    
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="User not found"
-        )
-    
-    if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="User account is not active"
-        )
-    
-    return user
+    return await _resolve_user(credentials.credentials, db, required=True)
 
 
 async def get_current_active_user(
@@ -177,74 +305,106 @@ async def get_current_verified_user(
     return current_user
 
 
+@dataclass(frozen=True, slots=True)
 class PermissionChecker:
     """
     Permission dependency checker.
     
+    Instances are immutable and compare by value, so identical checkers on
+    different routes share FastAPI's per-request dependency cache.
+    
     Usage:
-        @router.get("/admin", dependencies=[Depends(PermissionChecker("admin:read"))])
+        @router.get("/admin", dependencies=[Depends(PermissionChecker.of("admin:read"))])
     """
     
-    def __init__(self, required_permissions: List[str]):
-        self.required_permissions = required_permissions
+    required: FrozenSet[str]
+    _detail: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "required", frozenset(self.required))
+        # Denial message is rendered once; the exception is raised fresh
+        object.__setattr__(
+            self, "_detail", f"Permission(s) {sorted(self.required)} required"
+        )
+    
+    @classmethod
+    def of(cls, *permissions: str) -> "PermissionChecker":
+        """Create a checker requiring all of the given permissions."""
+        return cls(frozenset(permissions))
     
     async def __call__(
         self,
         current_user: User = Depends(get_current_verified_user)
     ) -> User:
         """Check if user has required permissions."""
-        user_permissions = current_user.get_permissions()
+        user_permissions = _permissions(current_user)
         
-        for permission in self.required_permissions:
-            if permission not in user_permissions:
-                raise HTTPException(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    detail=f"Permission '{permission}' required"
-                )
+        if not self.required.issubset(user_permissions):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail=self._detail
+            )
         
         return current_user
 
 
+@dataclass(frozen=True, slots=True)
 class RoleChecker:
     """
     Role dependency checker.
     
     Usage:
-        @router.get("/admin", dependencies=[Depends(RoleChecker(["admin", "manager"]))])
+        @router.get("/admin", dependencies=[Depends(RoleChecker.of("admin", "manager"))])
     """
     
-    def __init__(self, allowed_roles: List[str]):
-        self.allowed_roles = allowed_roles
+    allowed: FrozenSet[str]
+    _detail: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "allowed", frozenset(self.allowed))
+        object.__setattr__(
+            self,
+            "_detail",
+            f"One of these roles required: {', '.join(sorted(self.allowed))}"
+        )
+    
+    @classmethod
+    def of(cls, *roles: str) -> "RoleChecker":
+        """Create a checker allowing any of the given roles."""
+        return cls(frozenset(roles))
     
     async def __call__(
         self,
         current_user: User = Depends(get_current_verified_user)
     ) -> User:
         """Check if user has one of the allowed roles."""
-        user_roles = [role.name for role in current_user.roles]
+        # Set by _load_user; fall back for users resolved some other way
+        role_names = getattr(current_user, "_role_names", None)
+        if role_names is None:
+            role_names = [r.name for r in current_user.roles]
         
-        if not any(role in self.allowed_roles for role in user_roles):
+        if self.allowed.isdisjoint(role_names):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"One of these roles required: {', '.join(self.allowed_roles)}"
+                detail=self._detail
             )
         
         return current_user
 
 
 # Common permission dependencies
-require_admin = PermissionChecker(["admin:all"])
-require_project_read = PermissionChecker(["project:read"])
-require_project_write = PermissionChecker(["project:write"])
-require_story_read = PermissionChecker(["story:read"])
-require_story_write = PermissionChecker(["story:write"])
-require_document_read = PermissionChecker(["document:read"])
-require_document_write = PermissionChecker(["document:write"])
+require_admin = PermissionChecker.of("admin:all")
+require_project_read = PermissionChecker.of("project:read")
+require_project_write = PermissionChecker.of("project:write")
+require_story_read = PermissionChecker.of("story:read")
+require_story_write = PermissionChecker.of("story:write")
+require_document_read = PermissionChecker.of("document:read")
+require_document_write = PermissionChecker.of("document:write")
 
 # Common role dependencies
-require_admin_role = RoleChecker(["admin"])
-require_manager_role = RoleChecker(["admin", "manager"])
-require_member_role = RoleChecker(["admin", "manager", "member"])
+require_admin_role = RoleChecker.of("admin")
+require_manager_role = RoleChecker.of("admin", "manager")
+require_member_role = RoleChecker.of("admin", "manager", "member")
 
 
 async def get_current_user_optional(
@@ -264,31 +424,8 @@ async def get_current_user_optional(
     """
     if not token:
         return None
-        
-    try:
-        # Decode token
-        token_payload = AuthService.decode_token(token)
-        
-        # Verify token type
-        if token_payload.type != "access":
-            return None
-        
-        # Get user from database with roles
-        user_id = int(token_payload.sub)
-        result = await db.execute(
-            select(User)
-            .options(selectinload(User.roles))
-            .where(User.id == user_id)
-        )
-        user = result.scalar_one_or_none()
-        
-        if user and user.is_active:
-            return user
-            
-    except Exception:
-        pass
-        
-    return None
+    
+    return await _resolve_user(token, db, required=False)
 
 
 def require_permissions(user: User, permissions: List[str]) -> None:
@@ -303,7 +440,7 @@ def require_permissions(user: User, permissions: List[str]) -> None:
     Raises:
         HTTPException: If user lacks required permissions
     """
-    user_permissions = user.get_permissions()
+    user_permissions = _permissions(user)
     
     for permission in permissions:
         if permission not in user_permissions:
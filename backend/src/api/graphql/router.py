@@ -4,13 +4,15 @@ Sets up GraphQL endpoint with authentication and context.
 """
 
 from typing import Any, Dict, Optional
+
+import orjson
 from fastapi import Depends, Request, WebSocket, BackgroundTasks
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from strawberry.fastapi import GraphQLRouter
 from strawberry.types import Info
-from sqlalchemy.ext.asyncio import AsyncSession
 
-from backend.src.core.database import get_db
+from backend.src.core.config import settings
+from backend.src.core.database import AsyncSessionLocal
 from backend.src.api.deps import get_current_user_optional
 from backend.src.models.user import User
 from .schema import schema
@@ -26,20 +28,23 @@ async def get_context(
     request: Request = None,
     websocket: WebSocket = None,
     background_tasks: BackgroundTasks = None,
-    db: AsyncSession = Depends(get_db),
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Dict[str, Any]:
     """
-    Create GraphQL context with database session and current user.
+    Create GraphQL context with the current user.
+    
+    The user lookup uses its own short session; no session is held open
+    for the rest of the request.
     """
     # Get current user if authenticated
     current_user = None
     if credentials:
         try:
-            current_user = await get_current_user_optional(
-                token=credentials.credentials,
-                db=db
-            )
+            async with AsyncSessionLocal() as db:
+                current_user = await get_current_user_optional(
+                    token=credentials.credentials,
+                    db=db
+                )
         except Exception as e:
             logger.warning(f"Failed to authenticate GraphQL user: {e}")
     
@@ -47,14 +52,23 @@ async def get_context(
         "request": request,
         "websocket": websocket,
         "background_tasks": background_tasks,
-        "db": db,
         "current_user": current_user,
     }
 
 
+class ORJSONGraphQLRouter(GraphQLRouter):
+    """GraphQL router that encodes responses with orjson."""
+    
+    def encode_json(self, data: Any) -> str:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+        ).decode()
+
+
 # Create GraphQL router
-graphql_router = GraphQLRouter(
+graphql_router = ORJSONGraphQLRouter(
     schema=schema,
     context_getter=get_context,
-    graphiql=True,  # Enable GraphiQL playground in development
+    graphiql=not settings.is_production,  # GraphiQL playground outside production
 )
\ No newline at end of file
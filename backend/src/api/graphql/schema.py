@@ -5,8 +5,9 @@ Implements Relay-compliant schema with comprehensive types and operations.
 
 import strawberry
 from strawberry import relay
+from strawberry.extensions import ParserCache, ValidationCache
 from strawberry.types import Info
-from typing import List, Optional, AsyncIterator
+from typing import Dict, List, Optional, AsyncIterator
 from datetime import datetime
 import uuid
 
@@ -16,11 +17,32 @@ from backend.src.models.user import User as UserModel
 from backend.src.models.workspace import Workspace as WorkspaceModel
 from backend.src.models.agent import Agent as AgentModel
 from backend.src.models.organization import Organization as OrganizationModel
-from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 
+# Page info for connections with no results; never mutated
+_EMPTY_PAGE_INFO = relay.PageInfo(
+    has_next_page=False,
+    has_previous_page=False,
+    start_cursor=None,
+    end_cursor=None
+)
+
+
+# Empty connections by node type, built on first use and never mutated
+_EMPTY_CONNECTIONS: Dict[type, relay.Connection] = {}
+
+
+def _empty_connection(node_type: type) -> relay.Connection:
+    """Get the shared empty connection for node_type."""
+    connection = _EMPTY_CONNECTIONS.get(node_type)
+    if connection is None:
+        connection = relay.Connection[node_type](page_info=_EMPTY_PAGE_INFO, edges=[])
+        _EMPTY_CONNECTIONS[node_type] = connection
+    return connection
+
+
 # Enums
 
 @strawberry.enum
@@ -65,17 +87,8 @@ class Organization(relay.Node):
         after: Optional[str] = None
     ) -> relay.Connection["Workspace"]:
         """Get organization's workspaces."""
-        db: AsyncSession = info.context["db"]
         # Implementation would paginate workspaces
-        return relay.Connection[Workspace](
-            page_info=relay.PageInfo(
-                has_next_page=False,
-                has_previous_page=False,
-                start_cursor=None,
-                end_cursor=None
-            ),
-            edges=[]
-        )
+        return _empty_connection(Workspace)
 
 
 @strawberry.type
@@ -93,7 +106,6 @@ class User(relay.Node):
     @strawberry.field
     async def organization(self, info: Info) -> Optional[Organization]:
         """Get user's organization."""
-        db: AsyncSession = info.context["db"]
         user = info.context["current_user"]
         if user.organization:
             return Organization(
@@ -114,15 +126,7 @@ class User(relay.Node):
     ) -> relay.Connection["Workspace"]:
         """Get user's accessible workspaces."""
         # Implementation would paginate workspaces
-        return relay.Connection[Workspace](
-            page_info=relay.PageInfo(
-                has_next_page=False,
-                has_previous_page=False,
-                start_cursor=None,
-                end_cursor=None
-            ),
-            edges=[]
-        )
+        return _empty_connection(Workspace)
 
 
 @strawberry.type
@@ -151,15 +155,7 @@ class Workspace(relay.Node):
     ) -> relay.Connection["Agent"]:
         """Get workspace's agents with filtering."""
         # Implementation would paginate and filter agents
-        return relay.Connection[Agent](
-            page_info=relay.PageInfo(
-                has_next_page=False,
-                has_previous_page=False,
-                start_cursor=None,
-                end_cursor=None
-            ),
-            edges=[]
-        )
+        return _empty_connection(Agent)
     
     @strawberry.field
     async def members(
@@ -170,15 +166,7 @@ class Workspace(relay.Node):
     ) -> relay.Connection["WorkspaceMember"]:
         """Get workspace members."""
         # Implementation would paginate members
-        return relay.Connection[WorkspaceMember](
-            page_info=relay.PageInfo(
-                has_next_page=False,
-                has_previous_page=False,
-                start_cursor=None,
-                end_cursor=None
-            ),
-            edges=[]
-        )
+        return _empty_connection(WorkspaceMember)
 
 
 @strawberry.type
@@ -224,15 +212,7 @@ class Agent(relay.Node):
     ) -> relay.Connection["AgentExecution"]:
         """Get agent executions."""
         # Implementation would paginate executions
-        return relay.Connection[AgentExecution](
-            page_info=relay.PageInfo(
-                has_next_page=False,
-                has_previous_page=False,
-                start_cursor=None,
-                end_cursor=None
-            ),
-            edges=[]
-        )
+        return _empty_connection(AgentExecution)
 
 
 @strawberry.type
@@ -408,15 +388,7 @@ class Query:
     ) -> relay.Connection[User]:
         """List users with pagination and search."""
         # Implementation would check permissions and paginate
-        return relay.Connection[User](
-            page_info=relay.PageInfo(
-                has_next_page=False,
-                has_previous_page=False,
-                start_cursor=None,
-                end_cursor=None
-            ),
-            edges=[]
-        )
+        return _empty_connection(User)
     
     @strawberry.field
     async def workspaces(
@@ -428,15 +400,7 @@ class Query:
     ) -> relay.Connection[Workspace]:
         """List accessible workspaces."""
         # Implementation would check permissions and paginate
-        return relay.Connection[Workspace](
-            page_info=relay.PageInfo(
-                has_next_page=False,
-                has_previous_page=False,
-                start_cursor=None,
-                end_cursor=None
-            ),
-            edges=[]
-        )
+        return _empty_connection(Workspace)
     
     @strawberry.field
     async def agents(
@@ -451,15 +415,7 @@ class Query:
     ) -> relay.Connection[Agent]:
         """List agents with filtering."""
         # Implementation would check permissions and paginate
-        return relay.Connection[Agent](
-            page_info=relay.PageInfo(
-                has_next_page=False,
-                has_previous_page=False,
-                start_cursor=None,
-                end_cursor=None
-            ),
-            edges=[]
-        )
+        return _empty_connection(Agent)
 
 
 # Mutation Root
@@ -555,6 +511,11 @@ schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
     subscription=Subscription,
+    # Clients repeat the same documents; skip re-parsing and re-validating them
+    extensions=[
+        ParserCache(maxsize=256),
+        ValidationCache(maxsize=256),
+    ],
     config=strawberry.SchemaConfig(
         auto_camel_case=True  # Convert snake_case to camelCase
     )
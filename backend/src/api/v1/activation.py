@@ -3,21 +3,74 @@ User activation endpoints for development and testing.
 Provides a way to activate users when email verification is not configured.
 """
 import os
+import secrets
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import bindparam, lambda_stmt, or_, select, update
 
 from backend.src.api.deps import get_db
 from backend.src.models.user import User, UserStatus
 from backend.src.core.logging import get_logger
 from backend.src.core.config import settings
+from backend.src.services.auth import user_cache
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Admin keys are read once; the environment does not change at runtime.
+# Kept as bytes for secrets.compare_digest.
+ADMIN_ACTIVATION_KEY = os.getenv("ADMIN_ACTIVATION_KEY", "").encode()
+BULK_ACTIVATION_KEY = os.getenv("ADMIN_ACTIVATION_KEY", "dev-activate-key").encode()
+
+# Recent /status responses by email. Frontends poll this while waiting for
+# activation; entries are dropped on activation and misses are not cached.
+STATUS_CACHE_TTL = 5
+STATUS_CACHE_MAXSIZE = 10000
+_status_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Statements cached as lambda statements so each is compiled once
+_activate_by_email = lambda_stmt(
+    lambda: update(User)
+    .where(
+        User.email == bindparam("target_email"),
+        or_(User.status != UserStatus.active, User.email_verified.is_(False)),
+    )
+    .values(
+        status=UserStatus.active,
+        email_verified=True,
+        email_verified_at=bindparam("verified_at"),
+    )
+    .returning(User.id, User.status, User.email_verified)
+)
+_activation_by_email = lambda_stmt(
+    lambda: select(User.status, User.email_verified)
+    .where(User.email == bindparam("email"))
+)
+# Only the columns shown in the /status response; skips hashes, JSON prefs, etc.
+_status_by_email = lambda_stmt(
+    lambda: select(
+        User.email,
+        User.status,
+        User.email_verified,
+        User.is_deleted,
+        User.created_at,
+    ).where(User.email == bindparam("email"))
+)
+_activate_pending = lambda_stmt(
+    lambda: update(User)
+    .where(User.status == UserStatus.pending)
+    .values(
+        status=UserStatus.active,
+        email_verified=True,
+        email_verified_at=bindparam("verified_at"),
+    )
+    .returning(User.id)
+)
+
 
 @router.post("/activate/{email}")
 async def activate_user(
@@ -33,51 +86,53 @@ async def activate_user(
     """
     # In production, require a token
     if settings.ENVIRONMENT == "production":
-        admin_key = os.getenv("ADMIN_ACTIVATION_KEY", "")
-        if not token or (token != admin_key and len(admin_key) > 0):
+        if not token or (
+            ADMIN_ACTIVATION_KEY
+            and not secrets.compare_digest(token.encode(), ADMIN_ACTIVATION_KEY)
+        ):
             raise HTTPException(
                 status_code=403, 
                 detail="Activation token required in production"
             )
     
-    # Find user
+    # Activate in one round trip; users already active and verified are
+    # left untouched and return no row
     result = await db.execute(
-        select(User).where(User.email == email)
+        _activate_by_email,
+        {"target_email": email, "verified_at": datetime.now(timezone.utc)},
+        execution_options={"synchronize_session": False},
     )
-    user = result.scalar_one_or_none()
+    activated = result.one_or_none()
     
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-    
-    # Check if already active
-    if user.status == UserStatus.active and user.email_verified:
+    if activated is None:
+        # Nothing updated: either no such user or already active
+        result = await db.execute(_activation_by_email, {"email": email})
+        user = result.one_or_none()
+        
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        
         return {
             "message": "User already active",
             "status": user.status.value,
             "email_verified": user.email_verified
         }
     
+    await db.commit()
+    _status_cache.pop(email, None)
+    user_cache.invalidate(activated.id)
+    
     # Log activation
     logger.info(
         "user_activation", 
         email=email,
-        previous_status=user.status.value,
         environment=settings.ENVIRONMENT
     )
     
-    # Activate user
-    user.status = UserStatus.active
-    user.email_verified = True
-    user.email_verified_at = datetime.now(timezone.utc)
-    user.is_active = True
-    
-    await db.commit()
-    await db.refresh(user)
-    
     return {
         "message": f"User {email} activated successfully",
-        "status": user.status.value,
-        "email_verified": user.email_verified
+        "status": activated.status.value,
+        "email_verified": activated.email_verified
     }
 
 
@@ -87,21 +142,34 @@ async def check_user_status(
     db: AsyncSession = Depends(get_db)
 ):
     """Check user activation status"""
-    result = await db.execute(
-        select(User).where(User.email == email)
-    )
-    user = result.scalar_one_or_none()
+    now = time.monotonic()
+    entry = _status_cache.get(email)
+    if entry is not None:
+        expires_at, response = entry
+        if expires_at > now:
+            return response
+        del _status_cache[email]
+    
+    result = await db.execute(_status_by_email, {"email": email})
+    user = result.one_or_none()
     
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
-    return {
+    response = {
         "email": user.email,
         "status": user.status.value,
         "email_verified": user.email_verified,
-        "is_active": user.is_active,
+        "is_active": user.status == UserStatus.active and not user.is_deleted,
         "created_at": user.created_at.isoformat() if user.created_at else None
     }
+    
+    if len(_status_cache) >= STATUS_CACHE_MAXSIZE:
+        # Evict the oldest entry (dicts preserve insertion order)
+        del _status_cache[next(iter(_status_cache))]
+    _status_cache[email] = (now + STATUS_CACHE_TTL, response)
+    
+    return response
 
 
 @router.post("/activate-all-pending")
@@ -113,25 +181,24 @@ async def activate_all_pending_users(
     Activate all pending users - useful for development/testing
     """
     # Require admin key even in development for this bulk operation
-    expected_key = os.getenv("ADMIN_ACTIVATION_KEY", "dev-activate-key")
-    if admin_key != expected_key:
+    if admin_key is None or not secrets.compare_digest(
+        admin_key.encode(), BULK_ACTIVATION_KEY
+    ):
         raise HTTPException(status_code=403, detail="Invalid admin key")
     
-    # Find all pending users
+    # Activate all pending users in one UPDATE; is_active follows from status
     result = await db.execute(
-        select(User).where(User.status == UserStatus.pending)
+        _activate_pending,
+        {"verified_at": datetime.now(timezone.utc)},
+        execution_options={"synchronize_session": False},
     )
-    pending_users = result.scalars().all()
-    
-    activated_count = 0
-    for user in pending_users:
-        user.status = UserStatus.active
-        user.email_verified = True
-        user.email_verified_at = datetime.now(timezone.utc)
-        user.is_active = True
-        activated_count += 1
+    activated_ids = result.scalars().all()
+    activated_count = len(activated_ids)
     
     await db.commit()
+    _status_cache.clear()
+    for user_id in activated_ids:
+        user_cache.invalidate(user_id)
     
     return {
         "message": f"Activated {activated_count} users",
@@ -3,6 +3,7 @@ Authentication API endpoints.
 Implements OAuth2 password flow with JWT tokens and refresh token rotation.
 """
 
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Annotated, Optional
 
@@ -95,9 +96,9 @@ async def register(
     """
     # Check if email already exists
     result = await db.execute(
-        select(User).where(User.email == user_data.email)
+        select(User.id).where(User.email == user_data.email).limit(1)
     )
-    if result.scalar_one_or_none():
+    if result.scalar() is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
@@ -106,20 +107,23 @@ async def register(
     # Check if username already exists
     if user_data.username:
         result = await db.execute(
-            select(User).where(User.username == user_data.username)
+            select(User.id).where(User.username == user_data.username).limit(1)
         )
-        if result.scalar_one_or_none():
+        if result.scalar() is not None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Username already taken"
             )
     
+    # Hash off the event loop; bcrypt blocks for the full cost factor
+    password_hash = await asyncio.to_thread(AuthService.hash_password, user_data.password)
+    
     # Create user
     user = User(
         email=user_data.email,
         username=user_data.username,
         full_name=user_data.full_name,
-        password_hash=AuthService.hash_password(user_data.password),
+        password_hash=password_hash,
         status=UserStatus.pending
     )
     
@@ -432,7 +436,9 @@ async def change_password(
         )
     
     # Update password
-    current_user.password_hash = AuthService.hash_password(password_change.new_password)
+    current_user.password_hash = await asyncio.to_thread(
+        AuthService.hash_password, password_change.new_password
+    )
     
     # Revoke all tokens
     AuthService.revoke_all_user_tokens(current_user.id)
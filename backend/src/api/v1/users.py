@@ -3,6 +3,7 @@ User management API endpoints.
 Implements RESTful patterns with comprehensive user CRUD operations.
 """
 
+import asyncio
 from typing import Annotated, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -20,7 +21,7 @@ from backend.src.schemas.user import (
     UserListResponse,
     SortDirection
 )
-from backend.src.services.auth import AuthService
+from backend.src.services.auth import AuthService, user_cache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -183,9 +184,9 @@ async def create_user(
     
     # Check if email already exists
     existing = await db.execute(
-        select(User).where(User.email == user_data.email)
+        select(User.id).where(User.email == user_data.email).limit(1)
     )
-    if existing.scalar_one_or_none():
+    if existing.scalar() is not None:
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Email already registered"
@@ -194,9 +195,9 @@ async def create_user(
     # Check if username already exists
     if user_data.username:
         existing = await db.execute(
-            select(User).where(User.username == user_data.username)
+            select(User.id).where(User.username == user_data.username).limit(1)
         )
-        if existing.scalar_one_or_none():
+        if existing.scalar() is not None:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Username already taken"
@@ -219,7 +220,9 @@ async def create_user(
         is_active=user_data.is_active,
         preferences=user_data.preferences or {}
     )
-    user.hashed_password = auth_service.hash_password(user_data.password)
+    user.hashed_password = await asyncio.to_thread(
+        auth_service.hash_password, user_data.password
+    )
     
     db.add(user)
     await db.commit()
@@ -272,17 +275,19 @@ async def update_user(
     # Handle password update
     if "password" in update_data:
         auth_service = AuthService()
-        user.hashed_password = auth_service.hash_password(update_data.pop("password"))
+        user.hashed_password = await asyncio.to_thread(
+            auth_service.hash_password, update_data.pop("password")
+        )
     
     # Handle email uniqueness
     if "email" in update_data and update_data["email"] != user.email:
         existing = await db.execute(
-            select(User).where(
+            select(User.id).where(
                 (User.email == update_data["email"]) & 
                 (User.id != user_id)
-            )
+            ).limit(1)
         )
-        if existing.scalar_one_or_none():
+        if existing.scalar() is not None:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Email already in use"
@@ -291,12 +296,12 @@ async def update_user(
     # Handle username uniqueness
     if "username" in update_data and update_data["username"] != user.username:
         existing = await db.execute(
-            select(User).where(
+            select(User.id).where(
                 (User.username == update_data["username"]) & 
                 (User.id != user_id)
-            )
+            ).limit(1)
         )
-        if existing.scalar_one_or_none():
+        if existing.scalar() is not None:
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
                 detail="Username already taken"
@@ -313,6 +318,7 @@ async def update_user(
         setattr(user, field, value)
     
     await db.commit()
+    user_cache.invalidate(user.id)
     await db.refresh(user, ["organization", "roles"])
     
     logger.info(
@@ -364,6 +370,7 @@ async def delete_user(
     # Soft delete by deactivating
     user.is_active = False
     await db.commit()
+    user_cache.invalidate(user.id)
     
     logger.info(
         "user_deleted",
@@ -413,6 +420,7 @@ async def assign_role(
     if role not in user.roles:
         user.roles.append(role)
         await db.commit()
+        user_cache.invalidate(user.id)
     
     logger.info(
         "role_assigned",
@@ -451,6 +459,7 @@ async def remove_role(
     # Remove role if assigned
     user.roles = [r for r in user.roles if str(r.id) != role_id]
     await db.commit()
+    user_cache.invalidate(user.id)
     
     logger.info(
         "role_removed",
@@ -14,6 +14,21 @@ from backend.src.core.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Keys examined per SCAN step when clearing patterns
+SCAN_BATCH_SIZE = 1000
+
+# Runs a single SCAN step and unlinks its matches server-side, returning only
+# the next cursor and the number of keys removed. Each call is bounded by
+# COUNT, so Redis is never blocked by a full keyspace walk inside one script.
+SCAN_UNLINK_SCRIPT = """
+local result = redis.call('SCAN', ARGV[1], 'MATCH', ARGV[2], 'COUNT', ARGV[3])
+local deleted = 0
+if #result[2] > 0 then
+    deleted = redis.call('UNLINK', unpack(result[2]))
+end
+return {result[1], deleted}
+"""
+
 
 class RedisCache:
     """Redis cache manager with async support."""
@@ -22,6 +37,7 @@ class RedisCache:
         """Initialize Redis cache manager."""
         self._pool: Optional[ConnectionPool] = None
         self._client: Optional[redis.Redis] = None
+        self._scan_unlink = None
     
     async def connect(self) -> None:
         """Connect to Redis."""
@@ -33,6 +49,7 @@ class RedisCache:
                 max_connections=settings.REDIS_POOL_SIZE,
             )
             self._client = redis.Redis(connection_pool=self._pool)
+            self._scan_unlink = self._client.register_script(SCAN_UNLINK_SCRIPT)
             
             # Test connection
             await self._client.ping()
@@ -159,13 +176,16 @@ class RedisCache:
             return 0
         
         try:
-            keys = []
-            async for key in self._client.scan_iter(match=pattern):
-                keys.append(key)
-            
-            if keys:
-                return await self._client.delete(*keys)
-            return 0
+            # Keys never leave Redis; only the cursor and a count come back
+            deleted = 0
+            cursor = "0"
+            while True:
+                cursor, removed = await self._scan_unlink(
+                    args=[cursor, pattern, SCAN_BATCH_SIZE]
+                )
+                deleted += int(removed)
+                if str(cursor) == "0":
+                    return deleted
         except Exception as e:
             logger.error("cache_clear_pattern_error", pattern=pattern, error=str(e))
             return 0
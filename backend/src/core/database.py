@@ -26,6 +26,13 @@ if "sslmode=" in database_url:
     # Clean up URL if it ends with ? or has &&
     database_url = database_url.rstrip('?').replace('&&', '&')
 
+# Keep asyncpg's prepared statements hot across repeated queries.
+# Set DATABASE_STATEMENT_CACHE_SIZE=0 behind PgBouncer in transaction mode.
+# Other drivers (e.g. aiosqlite) do not accept this option.
+connect_args = {}
+if database_url.startswith("postgresql+asyncpg://"):
+    connect_args["statement_cache_size"] = settings.DATABASE_STATEMENT_CACHE_SIZE
+
 # Create async engine
 engine = create_async_engine(
     database_url,
@@ -33,8 +40,10 @@ engine = create_async_engine(
     pool_size=settings.DATABASE_POOL_SIZE,
     max_overflow=settings.DATABASE_MAX_OVERFLOW,
     pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
     pool_pre_ping=True,
     poolclass=NullPool if settings.is_testing else None,
+    connect_args=connect_args,
 )
 
 # Create async session maker
@@ -12,6 +12,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from prometheus_client import make_asgi_app
+from sqlalchemy import text
 
 from backend.src.core.config import settings
 from backend.src.core.database import init_db, close_db
@@ -207,7 +208,7 @@ async def readiness_check():
     try:
         from backend.src.core.database import engine
         async with engine.connect() as conn:
-            await conn.execute("SELECT 1")
+            await conn.execute(text("SELECT 1"))
         checks["database"] = True
     except Exception as e:
         logger.error("database_health_check_failed", error=str(e))
@@ -15,6 +15,7 @@ from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 from prometheus_client import make_asgi_app
+from sqlalchemy import text
 import structlog
 
 from backend.src.core.config import settings
@@ -393,7 +394,7 @@ async def readiness_check():
     try:
         from backend.src.core.database import get_db
         async for db in get_db():
-            await db.execute("SELECT 1")
+            await db.execute(text("SELECT 1"))
             checks["database"] = True
             break
     except Exception as e:
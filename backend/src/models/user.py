@@ -8,7 +8,7 @@ from typing import List, Optional
 
 from sqlalchemy import (
     Boolean, Column, DateTime, ForeignKey, Integer, String, Table, Text,
-    UniqueConstraint, Index, JSON, Enum as SQLEnum, func
+    UniqueConstraint, Index, JSON, Enum as SQLEnum, func, text
 )
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 import enum
@@ -117,6 +117,13 @@ class User(Base, TimestampMixin, SoftDeleteMixin):
     __table_args__ = (
         Index("idx_user_email_status", "email", "status"),
         Index("idx_user_username_status", "username", "status"),
+        # Pending users only: small, and serves bulk activation and
+        # newest-first pending listings (btree scans either direction)
+        Index(
+            "idx_user_pending_created",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
     
     def __repr__(self) -> str:
@@ -3,16 +3,20 @@ Authentication service with JWT and refresh token support.
 Implements enterprise-grade security best practices.
 """
 
+import asyncio
+import hashlib
 import os
 import secrets
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, FrozenSet, Tuple
 from uuid import uuid4
 
 from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from jose import JWTError, jwt
-from sqlalchemy import select, and_
+from sqlalchemy import and_, bindparam, lambda_stmt, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.src.core.config import settings
@@ -29,6 +33,24 @@ pwd_context = CryptContext(
     bcrypt__rounds=12  # Enterprise-grade security
 )
 
+# Login lookups, cached as lambda statements so the SELECT is compiled once
+_user_by_email = lambda_stmt(
+    lambda: select(User).where(
+        and_(
+            User.email == bindparam("login"),
+            User.is_deleted == False
+        )
+    )
+)
+_user_by_username = lambda_stmt(
+    lambda: select(User).where(
+        and_(
+            User.username == bindparam("login"),
+            User.is_deleted == False
+        )
+    )
+)
+
 
 class TokenBlacklist:
     """In-memory token blacklist for revoked tokens."""
@@ -55,6 +77,109 @@ class TokenBlacklist:
             del self._blacklist[jti]
 
 
+class VerifiedPasswordCache:
+    """
+    Short-lived in-memory record of successful password verifications.
+    
+    Entries are keyed by a keyed BLAKE2b digest of the password and the stored
+    bcrypt hash, so plaintext is never kept and a password change (new hash)
+    never matches an old entry. Failed verifications are not cached.
+    """
+    
+    def __init__(self, ttl: int = 300, maxsize: int = 10000):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._secret = secrets.token_bytes(32)
+        self._entries: Dict[bytes, float] = {}
+    
+    def _key(self, plain_password: str, hashed_password: str) -> bytes:
+        return hashlib.blake2b(
+            f"{plain_password}\0{hashed_password}".encode(),
+            key=self._secret,
+            digest_size=16,
+        ).digest()
+    
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify password, skipping bcrypt for recently verified pairs."""
+        key = self._key(plain_password, hashed_password)
+        now = time.monotonic()
+        
+        expires_at = self._entries.get(key)
+        if expires_at is not None:
+            if expires_at > now:
+                return True
+            del self._entries[key]
+        
+        if not pwd_context.verify(plain_password, hashed_password):
+            return False
+        
+        if len(self._entries) >= self._maxsize:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = now + self._ttl
+        return True
+
+
+@dataclass(frozen=True, slots=True)
+class CachedUser:
+    """Authorization snapshot of a user, safe to share across requests."""
+    
+    id: int
+    is_active: bool
+    email_verified: bool
+    permissions: FrozenSet[str]
+    role_names: Tuple[str, ...]
+    
+    @classmethod
+    def from_user(cls, user: User) -> "CachedUser":
+        """Snapshot a user whose roles and permissions are loaded."""
+        return cls(
+            id=user.id,
+            is_active=user.is_active,
+            email_verified=user.email_verified,
+            permissions=frozenset(user.get_permissions()),
+            role_names=tuple(role.name for role in user.roles),
+        )
+
+
+class UserCache:
+    """
+    Short-lived in-memory cache of user authorization snapshots by ID.
+    
+    Holds CachedUser values rather than ORM instances, so repeat requests
+    from the same user skip the permission lookup. Entries must be
+    invalidated whenever the user's status or roles change.
+    """
+    
+    def __init__(self, ttl: int = 30, maxsize: int = 5000):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._entries: Dict[int, Tuple[float, CachedUser]] = {}
+    
+    def get(self, user_id: int) -> Optional[CachedUser]:
+        """Get a cached snapshot, or None if missing or expired."""
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, cached = entry
+        if expires_at > time.monotonic():
+            return cached
+        del self._entries[user_id]
+        return None
+    
+    def set(self, cached: CachedUser) -> None:
+        """Cache a user snapshot."""
+        self._entries.pop(cached.id, None)
+        if len(self._entries) >= self._maxsize:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del self._entries[next(iter(self._entries))]
+        self._entries[cached.id] = (time.monotonic() + self._ttl, cached)
+    
+    def invalidate(self, user_id: int) -> None:
+        """Drop a cached user."""
+        self._entries.pop(user_id, None)
+
+
 class RefreshTokenStore:
     """Store for managing refresh token families."""
     
@@ -140,6 +265,8 @@ class RefreshTokenStore:
 # Global instances
 token_blacklist = TokenBlacklist()
 refresh_token_store = RefreshTokenStore()
+verified_password_cache = VerifiedPasswordCache()
+user_cache = UserCache()
 
 
 class AuthService:
@@ -148,7 +275,7 @@ class AuthService:
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify password against hash."""
-        return pwd_context.verify(plain_password, hashed_password)
+        return verified_password_cache.verify(plain_password, hashed_password)
     
     @staticmethod
     def hash_password(password: str) -> str:
@@ -234,26 +361,27 @@ class AuthService:
         """
         Decode and validate JWT token.
         
+        Raises:
+            HTTPException: If token is invalid
+        """
+        return AuthService.payload_from_claims(AuthService.verify_token_claims(token))
+    
+    @staticmethod
+    def verify_token_claims(token: str) -> Dict[str, Any]:
+        """
+        Verify a JWT's signature and expiry and return its claims.
+        
+        Touches no shared state, so it is safe to run in a worker thread.
+        
         Raises:
             HTTPException: If token is invalid
         """
         try:
-            payload = jwt.decode(
+            return jwt.decode(
                 token,
                 settings.SECRET_KEY,
                 algorithms=[settings.JWT_ALGORITHM]
             )
-            
-            # Check if token is blacklisted
-            jti = payload.get("jti")
-            if jti and token_blacklist.is_blacklisted(jti):
-                raise HTTPException(
-                    status_code=status.HTTP_401_UNAUTHORIZED,
-                    detail="Token has been revoked"
-                )
-            
-            return TokenPayload(**payload)
-            
         except JWTError as e:
             logger.error("jwt_decode_error", error=str(e))
             raise HTTPException(
@@ -262,6 +390,24 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
     
+    @staticmethod
+    def payload_from_claims(claims: Dict[str, Any]) -> TokenPayload:
+        """
+        Build a token payload from verified claims.
+        
+        Raises:
+            HTTPException: If the token has been revoked
+        """
+        # Check if token is blacklisted
+        jti = claims.get("jti")
+        if jti and token_blacklist.is_blacklisted(jti):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked"
+            )
+        
+        return TokenPayload(**claims)
+    
     @staticmethod
     async def authenticate_user(
         db: AsyncSession,
@@ -280,22 +426,8 @@ class AuthService:
             User if authenticated, None otherwise
         """
         # Check if username is email
-        if "@" in username:
-            query = select(User).where(
-                and_(
-                    User.email == username,
-                    User.is_deleted == False
-                )
-            )
-        else:
-            query = select(User).where(
-                and_(
-                    User.username == username,
-                    User.is_deleted == False
-                )
-            )
-        
-        result = await db.execute(query)
+        query = _user_by_email if "@" in username else _user_by_username
+        result = await db.execute(query, {"login": username})
         user = result.scalar_one_or_none()
         
         if not user:
@@ -472,6 +604,7 @@ class AuthService:
     def revoke_all_user_tokens(user_id: int) -> None:
         """Revoke all tokens for a user."""
         refresh_token_store.revoke_user_families(user_id)
+        user_cache.invalidate(user_id)
         # Note: Access tokens can't be fully revoked without a persistent store
         logger.info("user_tokens_revoked", user_id=user_id)
     
@@ -502,6 +635,7 @@ class AuthService:
                 if user.status == UserStatus.pending:
                     user.status = UserStatus.active
                 await db.commit()
+                user_cache.invalidate(user.id)
                 return user
                 
         except JWTError:
@@ -574,7 +708,9 @@ class AuthService:
             user = result.scalar_one_or_none()
             
             if user:
-                user.password_hash = AuthService.hash_password(new_password)
+                user.password_hash = await asyncio.to_thread(
+                    AuthService.hash_password, new_password
+                )
                 # Revoke all user tokens on password reset
                 AuthService.revoke_all_user_tokens(user.id)
                 # Blacklist the reset token
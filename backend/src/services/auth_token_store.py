@@ -132,12 +132,12 @@ class RedisRefreshTokenStore:
         # Scan for all families belonging to the user
         pattern = f"{self._prefix}*"
         
-        async for key in self.redis.scan_iter(match=pattern):
+        async for key in self.redis.scan_iter(match=pattern, count=1000):
             data = await self.redis.get(key)
             if data:
                 family = json.loads(data)
                 if family["user_id"] == user_id:
-                    await self.redis.delete(key)
+                    await self.redis.unlink(key)
     
     async def cleanup_expired(self) -> None:
         """Clean up expired token families."""
@@ -11,9 +11,8 @@ from pathlib import Path
 # Add backend source to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
-from src.core.config import settings
+from sqlalchemy import text
+from src.core.database import engine, AsyncSessionLocal
 from src.models.user import User
 from src.models.organization import Organization
 from src.models.workspace import Workspace
@@ -26,17 +25,13 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Create async engine
-engine = create_async_engine(settings.DATABASE_URL, echo=False)
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
 
 async def seed_database():
     """Seed database with initial development data."""
     async with AsyncSessionLocal() as session:
         try:
             # Check if data already exists
-            result = await session.execute("SELECT COUNT(*) FROM users")
+            result = await session.execute(text("SELECT COUNT(*) FROM users"))
             count = result.scalar()
             if count > 0:
                 logger.info("Database already contains data, skipping seed")
@@ -55,7 +55,10 @@ def test_neon_connection(database_url):
             print(f"{YELLOW}⚠ No tables found. Run database migrations.{RESET}")
         
         # Check for admin user
-        cur.execute("SELECT COUNT(*) FROM users WHERE email = 'admin@example.com';")
+        cur.execute(
+            "SELECT COUNT(*) FROM users WHERE email = %s;",
+            ("admin@example.com",)
+        )
         admin_exists = cur.fetchone()[0] > 0
         
         if admin_exists: